@@ -1,18 +1,49 @@
+import re
+import threading
+from itertools import count
+
 from mistune import Markdown  # type: ignore[import-untyped]
 from mistune import Renderer
 
+# mistune's Markdown keeps per-parse state (tokens, link defs) on the instance,
+# so a single shared parser is not safe across the bot's worker threads.
+# Keep one per thread instead of rebuilding the lexers/renderer on every call.
+_thread_local = threading.local()
+
+# Marker emitted by SlackRenderer.list_item, rewritten into bullets/numbers by list
+_LIST_ITEM_PATTERN = re.compile(r"^li: ", re.MULTILINE)
+
+
+def _get_markdown() -> Markdown:
+    markdown = getattr(_thread_local, "markdown", None)
+    if markdown is None:
+        markdown = Markdown(renderer=SlackRenderer())
+        _thread_local.markdown = markdown
+    return markdown
+
 
 def format_slack_message(message: str | None) -> str:
-    return Markdown(renderer=SlackRenderer()).render(message)
+    if message is None:
+        return ""
+    markdown = _get_markdown()
+    try:
+        return markdown.render(message)
+    except BaseException:
+        # mistune only resets its tokens/link definitions after a successful
+        # parse, so a failed render would leak this message into the next one
+        _thread_local.markdown = None
+        raise
 
 
 class SlackRenderer(Renderer):
     SPECIALS: dict[str, str] = {"&": "&amp;", "<": "&lt;", ">": "&gt;"}
+    _SPECIALS_TABLE = str.maketrans(SPECIALS)
 
     def escape_special(self, text: str) -> str:
-        for special, replacement in self.SPECIALS.items():
-            text = text.replace(special, replacement)
-        return text
+        # most URLs have nothing to escape, skip the translate in that case
+        if "&" not in text and "<" not in text and ">" not in text:
+            return text
+        return text.translate(self._SPECIALS_TABLE)
 
     def header(self, text: str, level: int, raw: str | None = None) -> str:
         return f"*{text}*\n"
@@ -27,14 +58,10 @@ class SlackRenderer(Renderer):
         return f"~{text}~"
 
     def list(self, body: str, ordered: bool = True) -> str:
-        lines = body.split("\n")
-        count = 0
-        for i, line in enumerate(lines):
-            if line.startswith("li: "):
-                count += 1
-                prefix = f"{count}. " if ordered else "• "
-                lines[i] = f"{prefix}{line[4:]}"
-        return "\n".join(lines)
+        if not ordered:
+            return _LIST_ITEM_PATTERN.sub("• ", body)
+        counter = count(1)
+        return _LIST_ITEM_PATTERN.sub(lambda _: f"{next(counter)}. ", body)
 
     def list_item(self, text: str) -> str:
         return f"li: {text}\n"
@@ -1,3 +1,5 @@
+import threading
+import time
 from typing import cast
 
 from fastapi import APIRouter
@@ -26,12 +28,20 @@ from onyx.utils.logger import setup_logger
 from onyx.utils.variable_functionality import (
     fetch_versioned_implementation_with_fallback,
 )
+from shared_configs.contextvars import get_current_tenant_id
 
 logger = setup_logger()
 
 admin_router = APIRouter(prefix="/admin/settings")
 basic_router = APIRouter(prefix="/settings")
 
+# The settings endpoint is polled by every open tab, while the reindex flag only
+# changes around an index swap. Keep it in-process for a few seconds per tenant;
+# nothing invalidates it, so a swap shows up here once the TTL runs out.
+_REINDEX_FLAG_TTL_SECONDS = 5.0
+_reindex_flag_cache: dict[str, tuple[float, bool | None]] = {}
+_reindex_flag_cache_lock = threading.Lock()
+
 
 @admin_router.put("")
 def admin_put_settings(
@@ -53,13 +63,10 @@ def fetch_settings(
     """Settings and notifications are stuffed into this single endpoint to reduce number of
     Postgres calls"""
     general_settings = load_settings()
-    settings_notifications = get_settings_notifications(user, db_session)
-
-    try:
-        kv_store = get_kv_store()
-        needs_reindexing = cast(bool, kv_store.load(KV_REINDEX_KEY))
-    except KvKeyNotFoundError:
-        needs_reindexing = False
+    # Read the flag once so the needs_reindexing field and the reindex
+    # notification below are always based on the same value
+    reindex_flag = _load_reindex_flag()
+    settings_notifications = get_settings_notifications(user, db_session, reindex_flag)
 
     apply_fn = fetch_versioned_implementation_with_fallback(
         "onyx.server.settings.api",
@@ -68,15 +75,38 @@ def fetch_settings(
     )
     general_settings = apply_fn(general_settings)
 
-    return UserSettings(
-        **general_settings.model_dump(),
+    # general_settings was already validated when it was loaded, so build the
+    # UserSettings from its fields without a model_dump + re-validate here.
+    # FastAPI still dumps and validates the returned model against the response model.
+    return UserSettings.model_construct(
+        **general_settings.__dict__,
         notifications=settings_notifications,
-        needs_reindexing=needs_reindexing,
+        needs_reindexing=bool(reindex_flag),
     )
 
 
+def _load_reindex_flag() -> bool | None:
+    """Returns the KV_REINDEX_KEY flag for the current tenant, or None if it is not set."""
+    tenant_id = get_current_tenant_id()
+    now = time.monotonic()
+    with _reindex_flag_cache_lock:
+        cached = _reindex_flag_cache.get(tenant_id)
+    if cached is not None and now - cached[0] < _REINDEX_FLAG_TTL_SECONDS:
+        return cached[1]
+
+    reindex_flag: bool | None
+    try:
+        reindex_flag = cast(bool, get_kv_store().load(KV_REINDEX_KEY))
+    except KvKeyNotFoundError:
+        reindex_flag = None
+
+    with _reindex_flag_cache_lock:
+        _reindex_flag_cache[tenant_id] = (now, reindex_flag)
+    return reindex_flag
+
+
 def get_settings_notifications(
-    user: User | None, db_session: Session
+    user: User | None, db_session: Session, reindex_flag: bool | None
 ) -> list[Notification]:
     """Get notifications for settings page, including product gating and reindex notifications"""
     # Check for product gating notification
@@ -93,19 +123,16 @@ def get_settings_notifications(
         return notifications
 
     # Check if reindexing is needed
-    kv_store = get_kv_store()
-    try:
-        needs_index = cast(bool, kv_store.load(KV_REINDEX_KEY))
-        if not needs_index:
-            dismiss_all_notifications(
-                notif_type=NotificationType.REINDEX, db_session=db_session
-            )
-            return notifications
-    except KvKeyNotFoundError:
+    if reindex_flag is None:
         # If something goes wrong and the flag is gone, better to not start a reindexing
         # it's a heavyweight long running job and maybe this flag is cleaned up later
         logger.warning("Could not find reindex flag")
         return notifications
+    if not reindex_flag:
+        dismiss_all_notifications(
+            notif_type=NotificationType.REINDEX, db_session=db_session
+        )
+        return notifications
 
     try:
         # Need a transaction in order to prevent under-counting current notifications
@@ -1,6 +1,8 @@
 """Tests for license database CRUD operations."""
 
-from unittest.mock import MagicMock
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import Mock
 
 from ee.onyx.db.license import delete_license
 from ee.onyx.db.license import get_license
@@ -8,18 +10,31 @@ from ee.onyx.db.license import upsert_license
 from onyx.db.models import License
 
 
+def _fake_session(first_result: License | None) -> Any:
+    """Session stub whose execute().scalars().first() returns first_result.
+
+    Only the methods the tests assert on are Mocks; the query chain is plain
+    SimpleNamespace so no child mocks get materialized per attribute access.
+    """
+    result = SimpleNamespace(
+        scalars=lambda: SimpleNamespace(first=lambda: first_result)
+    )
+    return SimpleNamespace(
+        execute=Mock(return_value=result),
+        add=Mock(),
+        commit=Mock(),
+        delete=Mock(),
+        refresh=Mock(),
+    )
+
+
 class TestGetLicense:
     """Tests for get_license function."""
 
     def test_get_existing_license(self) -> None:
         """Test getting an existing license."""
-        mock_session = MagicMock()
         mock_license = License(id=1, license_data="test_data")
-
-        # Mock the query chain
-        mock_session.execute.return_value.scalars.return_value.first.return_value = (
-            mock_license
-        )
+        mock_session = _fake_session(mock_license)
 
         result = get_license(mock_session)
 
@@ -29,8 +44,7 @@ class TestGetLicense:
 
     def test_get_no_license(self) -> None:
         """Test getting when no license exists."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.first.return_value = None
+        mock_session = _fake_session(None)
 
         result = get_license(mock_session)
 
@@ -42,8 +56,7 @@ class TestUpsertLicense:
 
     def test_insert_new_license(self) -> None:
         """Test inserting a new license when none exists."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.first.return_value = None
+        mock_session = _fake_session(None)
 
         upsert_license(mock_session, "new_license_data")
 
@@ -58,11 +71,8 @@ class TestUpsertLicense:
 
     def test_update_existing_license(self) -> None:
         """Test updating an existing license."""
-        mock_session = MagicMock()
         existing_license = License(id=1, license_data="old_data")
-        mock_session.execute.return_value.scalars.return_value.first.return_value = (
-            existing_license
-        )
+        mock_session = _fake_session(existing_license)
 
         upsert_license(mock_session, "updated_license_data")
 
@@ -78,11 +88,8 @@ class TestDeleteLicense:
 
     def test_delete_existing_license(self) -> None:
         """Test deleting an existing license."""
-        mock_session = MagicMock()
         existing_license = License(id=1, license_data="test_data")
-        mock_session.execute.return_value.scalars.return_value.first.return_value = (
-            existing_license
-        )
+        mock_session = _fake_session(existing_license)
 
         result = delete_license(mock_session)
 
@@ -92,8 +99,7 @@ class TestDeleteLicense:
 
     def test_delete_no_license(self) -> None:
         """Test deleting when no license exists."""
-        mock_session = MagicMock()
-        mock_session.execute.return_value.scalars.return_value.first.return_value = None
+        mock_session = _fake_session(None)
 
         result = delete_license(mock_session)
 
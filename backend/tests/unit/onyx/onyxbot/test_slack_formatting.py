@@ -0,0 +1,69 @@
+import pytest
+
+from onyx.onyxbot.slack.formatting import format_slack_message
+from onyx.onyxbot.slack.formatting import SlackRenderer
+
+
+def test_format_inline_styles() -> None:
+    assert (
+        format_slack_message("# Title\n\n*emph* **strong** ~~strike~~ `code`")
+        == "*Title*\n_emph_ *strong* ~strike~ `code`\n"
+    )
+
+
+def test_reused_parser_keeps_no_state_between_messages() -> None:
+    first = "[ref link][1]\n\n[1]: http://example.com"
+    assert format_slack_message(first) == "<http://example.com|ref link>\n"
+    assert format_slack_message("[ref link][1]") == "[ref link][1]\n"
+
+
+def test_format_none() -> None:
+    assert format_slack_message(None) == ""
+
+
+def test_format_link_escapes_url() -> None:
+    assert (
+        format_slack_message("[link](http://x.com/?a=1&b=<2>)")
+        == "<http://x.com/?a=1&amp;b=&lt;2&gt;|link>\n"
+    )
+
+
+def test_escape_special() -> None:
+    assert SlackRenderer().escape_special("a&b<c>d") == "a&amp;b&lt;c&gt;d"
+
+
+def test_format_unordered_list() -> None:
+    assert format_slack_message("- a\n- b\n- c") == "• a\n• b\n• c\n"
+
+
+def test_format_ordered_list() -> None:
+    assert (
+        format_slack_message("1. one\n2. two\n3. three\n\nafter")
+        == "1. one\n2. two\n3. three\nafter\n"
+    )
+
+
+def test_list_item_marker_outside_list_is_untouched() -> None:
+    assert format_slack_message("li: not a list\nline") == "li: not a list\nline\n"
+
+
+def test_escape_special_without_specials_returns_input() -> None:
+    url = "http://example.com/path?q=1"
+    assert SlackRenderer().escape_special(url) is url
+
+
+def test_failed_render_does_not_leak_into_next_message() -> None:
+    # Deeply nested emphasis makes mistune recurse until it raises
+    failing = (
+        "Private answer\n\n[doc]: http://private.example\n\n"
+        + "*" * 5000
+        + "x"
+        + "*" * 5000
+        + "\n\nTrailing paragraph"
+    )
+    with pytest.raises(RecursionError):
+        format_slack_message(failing)
+
+    assert format_slack_message("Next answer, see [doc]") == (
+        "Next answer, see [doc]\n"
+    )
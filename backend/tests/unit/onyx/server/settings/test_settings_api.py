@@ -0,0 +1,89 @@
+"""Tests for the in-process reindex flag cache used by the settings endpoint."""
+
+from collections.abc import Iterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from onyx.key_value_store.interface import KvKeyNotFoundError
+from onyx.server.settings import api
+from shared_configs.contextvars import CURRENT_TENANT_ID_CONTEXTVAR
+
+
+class _FakeClock:
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> _FakeClock:
+    fake_clock = _FakeClock()
+    monkeypatch.setattr("onyx.server.settings.api.time.monotonic", fake_clock)
+    return fake_clock
+
+
+@pytest.fixture
+def kv_store(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    store = MagicMock()
+    monkeypatch.setattr("onyx.server.settings.api.get_kv_store", lambda: store)
+    return store
+
+
+@pytest.fixture(autouse=True)
+def clear_reindex_flag_cache() -> Iterator[None]:
+    api._reindex_flag_cache.clear()
+    yield
+    api._reindex_flag_cache.clear()
+
+
+def _load_for_tenant(tenant_id: str) -> bool | None:
+    token = CURRENT_TENANT_ID_CONTEXTVAR.set(tenant_id)
+    try:
+        return api._load_reindex_flag()
+    finally:
+        CURRENT_TENANT_ID_CONTEXTVAR.reset(token)
+
+
+def test_flag_is_cached_within_ttl(clock: _FakeClock, kv_store: MagicMock) -> None:
+    kv_store.load.return_value = True
+
+    assert _load_for_tenant("tenant_a") is True
+    kv_store.load.return_value = False
+    clock.now += api._REINDEX_FLAG_TTL_SECONDS - 0.1
+
+    assert _load_for_tenant("tenant_a") is True
+    assert kv_store.load.call_count == 1
+
+
+def test_flag_is_reloaded_after_ttl(clock: _FakeClock, kv_store: MagicMock) -> None:
+    kv_store.load.return_value = True
+    assert _load_for_tenant("tenant_a") is True
+
+    kv_store.load.return_value = False
+    clock.now += api._REINDEX_FLAG_TTL_SECONDS
+
+    assert _load_for_tenant("tenant_a") is False
+    assert kv_store.load.call_count == 2
+
+
+def test_flag_is_cached_per_tenant(clock: _FakeClock, kv_store: MagicMock) -> None:
+    kv_store.load.return_value = True
+    assert _load_for_tenant("tenant_a") is True
+
+    kv_store.load.return_value = False
+    assert _load_for_tenant("tenant_b") is False
+
+    assert _load_for_tenant("tenant_a") is True
+    assert _load_for_tenant("tenant_b") is False
+    assert kv_store.load.call_count == 2
+
+
+def test_missing_flag_is_cached_as_none(clock: _FakeClock, kv_store: MagicMock) -> None:
+    kv_store.load.side_effect = KvKeyNotFoundError
+
+    assert _load_for_tenant("tenant_a") is None
+    assert _load_for_tenant("tenant_a") is None
+    assert kv_store.load.call_count == 1